@@ -4,20 +4,14 @@ __author__ = "Stéphane Brunner"
 __email__ = "stephane.brunner@gmail.com"
 __license__ = "Apache-2.0"
 
-
-try:
-    from importlib.metadata import version
-except ImportError:
-    from importlib_metadata import version
-
 import argparse
-import io
 import json
 import os
-import re
 import subprocess  # nosec
 import sys
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
 from typing import Optional, Union
 from urllib.parse import quote
 
@@ -26,6 +20,54 @@ import yaml
 
 __version__ = version("jsonschema2md")
 
+_PUNCT_SUFFIX = (".", "?", "!", ";")
+_LIST_ITEM_MARKERS = ("- ", "* ")
+# Prefix, schema keyword and label of the extra properties keywords
+_EXTRA_PROPS = (
+    ("additional", "additionalProperties", "Additional properties"),
+    ("unevaluated", "unevaluatedProperties", "Unevaluated properties"),
+)
+_SCHEMA_COMPOSITION_KEYWORDS = (
+    ("allOf", "All of"),
+    ("anyOf", "Any of"),
+    ("oneOf", "One of"),
+)
+# Keywords described after the description and the type
+_CONSTRAINT_KEYWORDS = frozenset(
+    [
+        "minimum",
+        "exclusiveMinimum",
+        "maximum",
+        "exclusiveMaximum",
+        "minItems",
+        "maxItems",
+        "enum",
+        "const",
+        *(property_name for _, property_name, _ in _EXTRA_PROPS),
+        "$ref",
+        "default",
+    ]
+)
+# Children of an object in reverse document order, as pushed on the parsing stack
+_SCHEMA_COMPOSITION_CHILDREN = tuple(reversed(_SCHEMA_COMPOSITION_KEYWORDS))
+_ITEMS_AND_DEFINITIONS_CHILDREN = tuple(
+    (property_name, property_name.capitalize()) for property_name in ("$defs", "definitions", "items")
+)
+_EXTRA_PROPS_CHILDREN = tuple((property_name, label) for _, property_name, label in reversed(_EXTRA_PROPS))
+_CHILD_KEYWORDS = frozenset(
+    [
+        "patternProperties",
+        "properties",
+        *(property_name for property_name, _ in _EXTRA_PROPS_CHILDREN),
+        *(property_name for property_name, _ in _ITEMS_AND_DEFINITIONS_CHILDREN),
+        *(key for key, _ in _SCHEMA_COMPOSITION_CHILDREN),
+    ]
+)
+# mdformat takes about 1.4 s on 300k characters, against 0.02 s to fork two workers and 0.4 s
+# to spawn them, below that formatting in one go is as fast
+_PARALLEL_FORMAT_MIN_SIZE = 300_000
+_TOP_LEVEL_BLOCK_STARTS = ("## ", "- ")
+
 
 class Parser:
     """
@@ -59,61 +101,90 @@ class Parser:
         show_examples = show_examples.lower()
         if show_examples in valid_show_examples_options:
             self.show_examples = show_examples
+            self._show_prop_examples = show_examples in ("all", "properties")
+            self._show_object_examples = show_examples in ("all", "object")
         else:
             raise ValueError(
                 f"`show_examples` option should be one of "
                 f"`{valid_show_examples_options}`; `{show_examples}` was passed."
             )
 
+        self._indent_cache: dict[int, str] = {}
+        self._last_line: Optional[str] = None
+        self._last_indent = 0
+        self._last_is_item = False
+        self._json_encoder = json.JSONEncoder(indent=4)
+        self._ref_cache: dict[str, str] = {}
+
+    def _indent(self, level: int) -> str:
+        """Get the indentation string for the given indent level."""
+        indentation = self._indent_cache.get(level)
+        if indentation is None:
+            indentation = " " * self.tab_size * level
+            self._indent_cache[level] = indentation
+        return indentation
+
+    def _ref_description(self, ref: str) -> str:
+        """Describe a `$ref` as a link to the referenced schema documentation."""
+        description = self._ref_cache.get(ref)
+        if description is None:
+            dest = ref[:-5] if ref.endswith(".json") else ref
+            title = os.path.basename(dest)
+            description = f"Includes all of *[{title}]({quote(dest)}.md)*."
+            self._ref_cache[ref] = description
+        return description
+
     def _construct_description_line(
         self, obj: dict, add_type: bool = False
     ) -> Sequence[str]:
         """Construct description line of property, definition, or item."""
-        description_line = []
+        description_line: list[str] = []
 
-        if "description" in obj:
-            ending = "" if re.search(r"[.?!;]$", obj["description"]) else "."
-            description_line.append(f"{obj['description']}{ending}")
+        description = obj.get("description")
+        if description is not None:
+            # Like a regex `$`, also accept the punctuation before a final line break
+            ending = "" if description.removesuffix("\n").endswith(_PUNCT_SUFFIX) else "."
+            description_line.append(f"{description}{ending}")
         if add_type:
-            if "type" in obj:
-                description_line.append(f"Must be of type *{obj['type']}*.")
-        if "minimum" in obj:
-            description_line.append(f"Minimum: `{obj['minimum']}`.")
-        if "exclusiveMinimum" in obj:
-            description_line.append(f"Exclusive minimum: `{obj['exclusiveMinimum']}`.")
-        if "maximum" in obj:
-            description_line.append(f"Maximum: `{obj['maximum']}`.")
-        if "exclusiveMaximum" in obj:
-            description_line.append(f"Exclusive maximum: `{obj['exclusiveMaximum']}`.")
-        if "minItems" in obj or "maxItems" in obj:
+            type_ = obj.get("type")
+            if type_ is not None:
+                description_line.append(f"Must be of type *{type_}*.")
+        if _CONSTRAINT_KEYWORDS.isdisjoint(obj):
+            return description_line
+        for key, label in (
+            ("minimum", "Minimum"),
+            ("exclusiveMinimum", "Exclusive minimum"),
+            ("maximum", "Maximum"),
+            ("exclusiveMaximum", "Exclusive maximum"),
+        ):
+            value = obj.get(key)
+            if value is not None:
+                description_line.append(f"{label}: `{value}`.")
+        min_items = obj.get("minItems")
+        max_items = obj.get("maxItems")
+        if min_items is not None or max_items is not None:
             length_description = "Length must be "
-            if "minItems" in obj and "maxItems" not in obj:
-                length_description += f"at least {obj['minItems']}."
-            elif "maxItems" in obj and "minItems" not in obj:
-                length_description += f"at most {obj['maxItems']}."
-            elif obj["minItems"] == obj["maxItems"]:
-                length_description += f"equal to {obj['minItems']}."
+            if max_items is None:
+                length_description += f"at least {min_items}."
+            elif min_items is None:
+                length_description += f"at most {max_items}."
+            elif min_items == max_items:
+                length_description += f"equal to {min_items}."
             else:
-                length_description += (
-                    f"between {obj['minItems']} and {obj['maxItems']} (inclusive)."
-                )
+                length_description += f"between {min_items} and {max_items} (inclusive)."
             description_line.append(length_description)
         if "enum" in obj:
             description_line.append(f"Must be one of: `{json.dumps(obj['enum'])}`.")
         if "const" in obj:
             description_line.append(f"Must be: `{json.dumps(obj['const'])}`.")
-        for extra_props in ["additional", "unevaluated"]:
-            if f"{extra_props}Properties" in obj:
-                if obj[f"{extra_props}Properties"]:
+        for extra_props, property_name, _ in _EXTRA_PROPS:
+            if property_name in obj:
+                if obj[property_name]:
                     description_line.append(f"Can contain {extra_props} properties.")
                 else:
                     description_line.append(f"Cannot contain {extra_props} properties.")
         if "$ref" in obj:
-            dest = obj["$ref"]
-            if dest.endswith(".json"):
-                dest = dest[:-5]
-            title = os.path.basename(dest)
-            description_line.append(f"Includes all of *[{title}]({quote(dest)}.md)*.")
+            description_line.append(self._ref_description(obj["$ref"]))
         if "default" in obj:
             description_line.append(f"Default: `{json.dumps(obj['default'])}`.")
 
@@ -126,25 +197,17 @@ class Parser:
     def _construct_examples(
         self, obj: dict, indent_level: int = 0, add_header: bool = True
     ) -> Sequence[str]:
-        def dump_json_with_line_head(obj, line_head, **kwargs):
-            result = [
-                line_head + line
-                for line in io.StringIO(json.dumps(obj, **kwargs)).readlines()
-            ]
-            return "".join(result)
-
-        def dump_yaml_with_line_head(obj, line_head, **kwargs):
-            result = [
-                line_head + line
-                for line in io.StringIO(
-                    yaml.dump(obj, sort_keys=False, **kwargs)
-                ).readlines()
-            ]
-            return "".join(result).rstrip()
-
-        example_lines = []
+        def dump_json_with_line_head(obj: object, line_head: str) -> str:
+            dumped = self._json_encoder.encode(obj)
+            return "".join(line_head + line for line in dumped.splitlines(keepends=True))
+
+        def dump_yaml_with_line_head(obj: object, line_head: str) -> str:
+            dumped = yaml.dump(obj, sort_keys=False, indent=4)
+            return "".join(line_head + line for line in dumped.splitlines(keepends=True)).rstrip()
+
+        example_lines: list[str] = []
         if "examples" in obj:
-            example_indentation = " " * self.tab_size * indent_level
+            example_indentation = self._indent(indent_level)
             if add_header:
                 example_lines.append(f"\n{example_indentation}Examples:\n")
             for example in obj["examples"]:
@@ -154,22 +217,29 @@ class Parser:
                 else:
                     lang = "json"
                     dump_fn = dump_json_with_line_head
-                example_str = dump_fn(example, line_head=example_indentation, indent=4)
+                example_str = dump_fn(example, line_head=example_indentation)
                 example_lines.append(
                     f"{example_indentation}```{lang}\n{example_str}\n{example_indentation}```\n\n"
                 )
         return example_lines
 
-    def append_line(self, line: str, new_lines: list[str]):
+    def append_line(self, line: str, new_lines: list[str]) -> None:
+        indentation = len(line) - len(line.lstrip(" "))
         if new_lines:
-            last_indent = len(new_lines[-1]) - len(new_lines[-1].lstrip())
-            indentation = len(line) - len(line.lstrip())
-            if last_indent != indentation and not new_lines[-1].lstrip()[:2] not in [
-                "- ",
-                "* ",
-            ]:
+            last_line = new_lines[-1]
+            # Reuse what was computed on the previous call when the last line is ours
+            if last_line is self._last_line:
+                last_indent = self._last_indent
+                last_is_item = self._last_is_item
+            else:
+                last_indent = len(last_line) - len(last_line.lstrip(" "))
+                last_is_item = last_line[last_indent : last_indent + 2] in _LIST_ITEM_MARKERS
+            if last_is_item and last_indent != indentation:
                 new_lines.append("\n")
         new_lines.append(line)
+        self._last_line = line
+        self._last_indent = indentation
+        self._last_is_item = line[indentation : indentation + 2] in _LIST_ITEM_MARKERS
 
     def _parse_object(
         self,
@@ -178,143 +248,142 @@ class Parser:
         name_monospace: bool = True,
         parsed_lines: Optional[list[str]] = None,
         indent_level: int = 0,
-        path: Optional[list[str]] = None,
+        anchor_prefix: Optional[str] = None,
         required: bool = False,
     ) -> list[str]:
-        """Parse JSON object and its items, definitions, and properties recursively."""
+        """Parse JSON object and its items, definitions, and properties."""
 
         if not parsed_lines:
             parsed_lines = []
 
-        indentation = " " * self.tab_size * indent_level
-        indentation_items = " " * self.tab_size * (indent_level + 1)
+        # Depth-first traversal with an explicit stack instead of recursion, visited objects push
+        # their children (tuples), composition labels (str) and examples (list) in reverse so they
+        # are popped in document order
+        stack: list = [(obj, name, name_monospace, indent_level, anchor_prefix, required)]
+        visit_object = self._visit_object
+        while stack:
+            task = stack.pop()
+            task_type = type(task)
+            if task_type is tuple:
+                visit_object(parsed_lines, stack, *task)
+            elif task_type is str:
+                self.append_line(task, parsed_lines)
+            else:
+                parsed_lines.extend(task)
 
-        if isinstance(obj, list):
-            self.append_line(f"{indentation}- **{name}**:\n", parsed_lines)
+        return parsed_lines
 
-            for element in obj:
-                parsed_lines = self._parse_object(
-                    element,
-                    None,
-                    name_monospace=False,
-                    parsed_lines=parsed_lines,
-                    indent_level=indent_level + 1,
-                )
-            return parsed_lines
+    def _visit_object(
+        self,
+        parsed_lines: list[str],
+        stack: list,
+        obj: object,
+        name: Optional[str],
+        name_monospace: bool,
+        indent_level: int,
+        anchor_prefix: Optional[str],
+        required: bool,
+    ) -> None:
+        """Add the line of a JSON object and push what follows it on the stack."""
+
+        indentation = self._indent(indent_level)
+        child_level = indent_level + 1
 
         if not isinstance(obj, dict):
-            raise TypeError(
-                f"Non-object type found in properties list: `{name}: {obj}`."
-            )
+            if not isinstance(obj, list):
+                raise TypeError(
+                    f"Non-object type found in properties list: `{name}: {obj}`."
+                )
+            self.append_line(f"{indentation}- **{name}**:\n", parsed_lines)
+            for element in obj[::-1]:
+                stack.append((element, None, False, child_level, None, False))
+            return
 
-        # Construct full description line
-        description_line_base = self._construct_description_line(obj)
-        description_line_list = list(
-            map(
-                lambda line: line.replace("\n\n", "<br>" + indentation_items),
-                description_line_base,
-            )
-        )
+        # Construct full description line, the parts are joined with spaces so the paragraph
+        # breaks are the ones of the parts
+        description_line = " ".join(self._construct_description_line(obj))
+        if "\n\n" in description_line:
+            description_line = description_line.replace("\n\n", "<br>" + self._indent(child_level))
 
         # Add full line to output
-        description_line = " ".join(description_line_list)
-        optional_format = f", format: {obj['format']}" if "format" in obj else ""
+        type_ = obj.get("type")
+        format_ = obj.get("format")
+        optional_format = f", format: {format_}" if format_ is not None else ""
         if name is None:
-            obj_type = f"*{obj['type']}{optional_format}*" if "type" in obj else ""
+            obj_type = f"*{type_}{optional_format}*" if type_ is not None else ""
             name_formatted = ""
         else:
             required_str = ", required" if required else ""
-            obj_type = (
-                f" *({obj['type']}{optional_format}{required_str})*"
-                if "type" in obj
-                else ""
-            )
+            obj_type = f" *({type_}{optional_format}{required_str})*" if type_ is not None else ""
             name_formatted = f"**`{name}`**" if name_monospace else f"**{name}**"
-        anchor = f'<a id="{quote("/".join(path))}"></a>' if path else ""
+        anchor = f'<a id="{anchor_prefix}"></a>' if anchor_prefix else ""
         self.append_line(
             f"{indentation}- {anchor}{name_formatted}{obj_type}{description_line}\n",
             parsed_lines,
         )
 
-        # Recursively parse subschemas following schema composition keywords
-        schema_composition_keyword_map = {
-            "allOf": "All of",
-            "anyOf": "Any of",
-            "oneOf": "One of",
-        }
-        for key, label in schema_composition_keyword_map.items():
-            if key in obj:
-                self.append_line(
-                    f"{indentation_items}- **{label}**\n",
-                    parsed_lines,
-                )
-                for child_obj in obj[key]:
-                    parsed_lines = self._parse_object(
-                        child_obj,
-                        None,
-                        name_monospace=False,
-                        parsed_lines=parsed_lines,
-                        indent_level=indent_level + 2,
-                    )
+        # What follows is pushed last to first
+        # Add examples
+        if self._show_prop_examples and "examples" in obj:
+            stack.append(self._construct_examples(obj, indent_level=indent_level))
 
-        # Recursively add items and definitions
-        for property_name in ["items", "definitions", "$defs"]:
-            if property_name in obj:
-                parsed_lines = self._parse_object(
-                    obj[property_name],
-                    property_name.capitalize(),
-                    name_monospace=False,
-                    parsed_lines=parsed_lines,
-                    indent_level=indent_level + 1,
-                )
+        if _CHILD_KEYWORDS.isdisjoint(obj):
+            return
 
-        # Recursively add additional child properties
-        for extra_props in ["additional", "unevaluated"]:
-            property_name = f"{extra_props}Properties"
+        # Add child properties
+        for property_name in ("patternProperties", "properties"):
+            if property_name in obj:
+                # Draft 3 uses a boolean `required` on the property itself
+                required_names = obj.get("required")
+                required_set = frozenset(required_names) if isinstance(required_names, list) else frozenset()
+                for child_name, child_obj in reversed(obj[property_name].items()):
+                    stack.append((child_obj, child_name, True, child_level, None, child_name in required_set))
+
+        # Add additional child properties
+        for property_name, label in _EXTRA_PROPS_CHILDREN:
             if property_name in obj and isinstance(obj[property_name], dict):
-                parsed_lines = self._parse_object(
-                    obj[property_name],
-                    f"{extra_props.capitalize()} properties",
-                    name_monospace=False,
-                    parsed_lines=parsed_lines,
-                    indent_level=indent_level + 1,
-                )
+                stack.append((obj[property_name], label, False, child_level, None, False))
 
-        # Recursively add child properties
-        for property_name in ["properties", "patternProperties"]:
+        # Add items and definitions
+        for property_name, label in _ITEMS_AND_DEFINITIONS_CHILDREN:
             if property_name in obj:
-                for property_name, property_obj in obj[property_name].items():
-                    parsed_lines = self._parse_object(
-                        property_obj,
-                        property_name,
-                        parsed_lines=parsed_lines,
-                        indent_level=indent_level + 1,
-                        required=property_name in obj.get("required", []),
-                    )
-
-        # Add examples
-        if self.show_examples in ["all", "properties"]:
-            parsed_lines.extend(
-                self._construct_examples(obj, indent_level=indent_level)
-            )
+                stack.append((obj[property_name], label, False, child_level, None, False))
 
-        return parsed_lines
+        # Parse subschemas following schema composition keywords
+        label_line = None
+        for key, label in _SCHEMA_COMPOSITION_CHILDREN:
+            if key in obj:
+                for child_obj in obj[key][::-1]:
+                    stack.append((child_obj, None, False, indent_level + 2, None, False))
+                label_line = f"{self._indent(child_level)}- **{label}**\n"
+                stack.append(label_line)
+        if label_line is not None and self.tab_size != 0:
+            # The first label is right after the object line, a list item with a smaller
+            # indentation, so `append_line` would always add the separator
+            stack.pop()
+            parsed_lines.extend(("\n", label_line))
+            self._last_line = label_line
+            self._last_indent = len(label_line) - len(label_line.lstrip(" "))
+            self._last_is_item = True
 
     def parse_schema(self, schema_object_master: dict) -> Sequence[str]:
         """Parse JSON Schema object to markdown text."""
 
-        def gather_props(obj: dict, prop: str) -> list[dict]:
-            """Gather properties from schema object and allOf's."""
-            res = []
-
-            if prop in obj:
-                res.append(obj[prop])
+        def gather_props(obj: dict, props: dict[str, list]) -> dict[str, list]:
+            """Gather properties from schema object and allOf's in a single walk."""
+            for prop, res in props.items():
+                if prop in obj:
+                    res.append(obj[prop])
             if "allOf" in obj:
                 for sub_obj in obj["allOf"]:
-                    res.extend(gather_props(sub_obj, prop))
-            return res
+                    gather_props(sub_obj, props)
+            return props
 
-        output_lines = []
+        self._last_line = None
+        output_lines: list[str] = []
+        gathered_props = gather_props(
+            schema_object_master, {"items": [], "patternProperties": [], "properties": []}
+        )
 
         # Add title and description
         if "title" in schema_object_master:
@@ -327,7 +396,7 @@ class Parser:
 
         # Add items
         first = False
-        for schema_object in gather_props(schema_object_master, "items"):
+        for schema_object in gathered_props["items"]:
             if not first:
                 output_lines.append("## Items\n\n")
                 first = True
@@ -335,8 +404,7 @@ class Parser:
             output_lines.extend(new_lines)
 
         # Add additional/unevaluated properties
-        for extra_props in ["additional", "unevaluated"]:
-            property_name = f"{extra_props}Properties"
+        for extra_props, property_name, _ in _EXTRA_PROPS:
             title_ = f"{extra_props.capitalize()} Properties"
             if property_name in schema_object_master and isinstance(
                 schema_object_master[property_name], dict
@@ -351,7 +419,7 @@ class Parser:
 
         # Add pattern properties
         first = False
-        for schema_object in gather_props(schema_object_master, "patternProperties"):
+        for schema_object in gathered_props["patternProperties"]:
             if not first:
                 output_lines.append("## Pattern Properties\n\n")
                 first = True
@@ -361,37 +429,63 @@ class Parser:
 
         # Add properties
         first = True
-        for schema_object in gather_props(schema_object_master, "properties"):
+        for schema_object in gathered_props["properties"]:
             if first:
                 output_lines.append("## Properties\n\n")
                 first = False
+            required_set = frozenset(schema_object.get("required", ()))
             for obj_name, obj in schema_object.items():
-                required = obj_name in schema_object.get("required", [])
+                required = obj_name in required_set
                 new_lines = self._parse_object(obj, obj_name, required=required)
                 output_lines.extend(new_lines)
 
         # Add definitions / $defs
         for name in ["definitions", "$defs"]:
             if name in schema_object_master:
+                anchor_name = quote(name)
                 for obj_name, obj in schema_object_master[name].items():
-                    new_lines = self._parse_object(obj, obj_name, path=[name, obj_name])
+                    new_lines = self._parse_object(
+                        obj, obj_name, anchor_prefix=f"{anchor_name}/{quote(obj_name)}"
+                    )
                     output_lines.extend(new_lines)
 
         # Add examples
-        if "examples" in schema_object_master and self.show_examples in [
-            "all",
-            "object",
-        ]:
+        if "examples" in schema_object_master and self._show_object_examples:
             output_lines.append("## Examples\n\n")
-            new_lines = self._construct_examples(
-                schema_object_master, indent_level=0, add_header=False
+            output_lines.extend(
+                self._construct_examples(schema_object_master, indent_level=0, add_header=False)
             )
-            output_lines.extend(new_lines)
 
         return output_lines
 
 
-def main():
+def _markdown_blocks(lines: Sequence[str]) -> list[str]:
+    """
+    Join the parsed Markdown lines into blocks that mdformat can format independently.
+
+    Small documents give a single block. Large ones are cut before each section header and
+    top-level list item, examples being single lines their code blocks are never cut.
+    """
+    if len(lines) < 2 or sum(len(line) for line in lines) < _PARALLEL_FORMAT_MIN_SIZE:
+        return ["\n".join(lines)]
+    blocks: list[list[str]] = [[]]
+    for line in lines:
+        if line.startswith(_TOP_LEVEL_BLOCK_STARTS) and blocks[-1]:
+            blocks.append([])
+        blocks[-1].append(line)
+    return ["\n".join(block) for block in blocks]
+
+
+def _format_markdown(blocks: list[str]) -> str:
+    """Format the Markdown blocks with mdformat, in worker processes if there are several."""
+    workers = os.cpu_count() or 1
+    if len(blocks) == 1 or workers == 1:
+        return mdformat.text("\n".join(blocks))
+    with ProcessPoolExecutor() as executor:
+        return "\n".join(executor.map(mdformat.text, blocks, chunksize=max(1, len(blocks) // (workers * 4))))
+
+
+def main() -> None:
     """Convert JSON Schema to Markdown documentation."""
 
     argparser = argparse.ArgumentParser(
@@ -416,6 +510,11 @@ def main():
         default="object",
         help="Parse examples for only the main object, only properties, or all.",
     )
+    argparser.add_argument(
+        "--no-format",
+        action="store_true",
+        help="Write the generated Markdown without reformatting it with mdformat.",
+    )
     argparser.add_argument("input_json", help="Input JSON file.")
     argparser.add_argument("output_markdown", help="Output Markdown file.")
 
@@ -429,11 +528,16 @@ def main():
         examples_as_yaml=args.examples_as_yaml, show_examples=args.show_examples
     )
     with open(args.input_json, encoding="utf-8") as input_json:
+        # The parser keeps no reference to the schema, so it is released once parsed
         output_md = parser.parse_schema(json.load(input_json))
+    if args.no_format:
+        markdown = "".join(output_md)
+    else:
+        blocks = _markdown_blocks(output_md)
+        del output_md  # Only keep the joined blocks while formatting
+        markdown = _format_markdown(blocks)
 
     with open(args.output_markdown, "w", encoding="utf-8") as output_markdown:
-        text = "\n".join(output_md)
-        markdown = mdformat.text(text)
         output_markdown.write(markdown)
 
     if args.pre_commit:
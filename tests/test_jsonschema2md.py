@@ -1,5 +1,7 @@
 """Test jsonschema2md."""
 
+import json
+
 import jsonschema2md
 
 
@@ -450,3 +452,110 @@ class TestParser:
             "      - **Items** *(number)*\n",
         ]
         assert expected_output == parser.parse_schema(test_schema)
+
+    def test_parse_deeply_nested_schema(self):
+        parser = jsonschema2md.Parser()
+        test_schema = {"type": "string"}
+        for _ in range(2000):
+            test_schema = {"type": "object", "properties": {"nested": test_schema}}
+
+        output = [line for line in parser._parse_object(test_schema, "root") if line != "\n"]
+
+        assert len(output) == 2001
+        assert output[0] == "- **`root`** *(object)*\n"
+        assert output[-1] == "  " * 2000 + "- **`nested`** *(string)*\n"
+
+    def test_format_markdown_by_block(self, monkeypatch):
+        parser = jsonschema2md.Parser(examples_as_yaml=True)
+        test_schema = dict(self.test_schema, examples=[["- not an item", "value"]])
+        lines = parser.parse_schema(test_schema)
+
+        expected_output = jsonschema2md._format_markdown(jsonschema2md._markdown_blocks(lines))
+        monkeypatch.setattr(jsonschema2md, "_PARALLEL_FORMAT_MIN_SIZE", 0)
+        monkeypatch.setattr(jsonschema2md.os, "cpu_count", lambda: 2)
+        blocks = jsonschema2md._markdown_blocks(lines)
+
+        assert len(blocks) > len([line for line in lines if line.startswith("## ")]) + 1
+        assert expected_output == jsonschema2md._format_markdown(blocks)
+
+    def test_parse_draft3_boolean_required(self):
+        parser = jsonschema2md.Parser()
+        test_schema = {
+            "properties": {
+                "a": {"type": "string", "required": True},
+                "b": {"type": "object", "required": True, "properties": {"c": {"type": "string"}}},
+            }
+        }
+
+        output = [line for line in parser.parse_schema(test_schema) if line != "\n"]
+
+        assert output == [
+            "# JSON Schema\n\n",
+            "## Properties\n\n",
+            "- **`a`** *(string)*\n",
+            "- **`b`** *(object)*\n",
+            "  - **`c`** *(string)*\n",
+        ]
+
+    def test_parse_shared_sub_schema(self):
+        shared = {"type": "object", "description": "Shared.", "properties": {"x": {"type": "string"}}}
+        test_schema = {
+            "properties": {
+                "a": {"allOf": [shared, shared, shared]},
+                "b": {
+                    "oneOf": [
+                        {"type": "object", "properties": {"deep": {"type": "string"}}},
+                        shared,
+                        {"type": "string", "examples": ["value"]},
+                        shared,
+                    ]
+                },
+            }
+        }
+        unshared_schema = json.loads(json.dumps(test_schema))
+
+        output = jsonschema2md.Parser().parse_schema(test_schema)
+
+        assert output == jsonschema2md.Parser().parse_schema(unshared_schema)
+
+    def test_parse_empty_first_composition(self):
+        test_schema = {"properties": {"a": {"allOf": [], "anyOf": [{"type": "string"}]}}}
+
+        output = jsonschema2md.Parser().parse_schema(test_schema)
+
+        assert output == [
+            "# JSON Schema\n\n",
+            "## Properties\n\n",
+            "- **`a`**\n",
+            "\n",
+            "  - **All of**\n",
+            "  - **Any of**\n",
+            "\n",
+            "    - *string*\n",
+        ]
+
+    def test_parse_top_level_items_array(self):
+        test_schema = {"items": [{"type": "string"}]}
+
+        output = jsonschema2md.Parser().parse_schema(test_schema)
+
+        assert output == [
+            "# JSON Schema\n\n",
+            "## Items\n\n",
+            "- **Items**:\n",
+            "\n",
+            "  - *string*\n",
+        ]
+
+    def test_main_no_format(self, monkeypatch, tmp_path):
+        input_json = tmp_path / "schema.json"
+        input_json.write_text(json.dumps(self.test_schema), encoding="utf-8")
+        output_markdown = tmp_path / "schema.md"
+        monkeypatch.setattr(
+            "sys.argv", ["jsonschema2md", "--no-format", str(input_json), str(output_markdown)]
+        )
+
+        jsonschema2md.main()
+
+        expected_output = "".join(jsonschema2md.Parser(show_examples="object").parse_schema(self.test_schema))
+        assert expected_output == output_markdown.read_text(encoding="utf-8")